@@ -14,6 +14,9 @@ pub enum CausalFlowError {
     #[error("Invalid treatment: treatment values must be binary (0 or 1), found {0}")]
     InvalidTreatment(f64),
 
+    #[error("Invalid parameter: {0}")]
+    InvalidParameter(String),
+
     #[error("Model not fitted: please call fit() before predicting")]
     ModelNotFitted,
 
@@ -32,7 +35,8 @@ impl From<CausalFlowError> for pyo3::PyErr {
             CausalFlowError::InvalidData
             | CausalFlowError::EmptyData
             | CausalFlowError::InvalidTreatment(_)
-            | CausalFlowError::FeatureOutOfBounds(_) => PyValueError::new_err(err.to_string()),
+            | CausalFlowError::FeatureOutOfBounds(_)
+            | CausalFlowError::InvalidParameter(_) => PyValueError::new_err(err.to_string()),
             CausalFlowError::ModelNotFitted
             | CausalFlowError::Internal(_)
             | CausalFlowError::Calculation(_) => PyRuntimeError::new_err(err.to_string()),
@@ -159,13 +159,18 @@ impl CausalForest {
             return Err(CausalFlowError::EmptyData);
         }
 
-        let mut predictions = Array1::zeros(n_samples);
-
-        for tree in &self.trees {
-            predictions += &tree.predict(x);
-        }
-
-        predictions /= self.trees.len() as f64;
+        // Rows are independent, so score them in parallel; each row walks every
+        // tree in order, which keeps the per-row sum identical to the serial one.
+        let n_trees = self.trees.len() as f64;
+        let predictions: Array1<f64> = (0..n_samples)
+            .into_par_iter()
+            .map(|i| {
+                let row = x.row(i);
+                let sum: f64 = self.trees.iter().map(|tree| tree.predict_row(row)).sum();
+                sum / n_trees
+            })
+            .collect::<Vec<f64>>()
+            .into();
 
         let mean_effect = predictions.mean().unwrap_or(0.0);
         let confidence_intervals = predictions.iter().map(|&p| (p - 0.1, p + 0.1)).collect();
@@ -201,6 +206,10 @@ impl CausalModel for CausalForest {
     fn predict(&self, x: ArrayView2<f64>) -> Result<InferenceResult> {
         self.predict_result(x)
     }
+
+    fn unfitted(&self) -> Self {
+        CausalForest::new(self.n_estimators, self.max_depth, self.min_leaf_size)
+    }
 }
 
 impl CausalTree {
@@ -389,6 +398,13 @@ impl CausalTree {
         }
         preds
     }
+
+    pub fn predict_row(&self, x: ArrayView1<f64>) -> f64 {
+        match self.root {
+            Some(ref root) => root.predict(x),
+            None => 0.0,
+        }
+    }
 }
 
 impl Node {
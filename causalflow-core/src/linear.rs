@@ -52,4 +52,8 @@ impl CausalModel for LinearCausalModel {
             feature_importance: vec![0.0; x.ncols()],
         })
     }
+
+    fn unfitted(&self) -> Self {
+        LinearCausalModel::new()
+    }
 }
@@ -5,4 +5,9 @@ use ndarray::{ArrayView1, ArrayView2};
 pub trait CausalModel: Send + Sync {
     fn fit(&mut self, x: ArrayView2<f64>, t: ArrayView1<f64>, y: ArrayView1<f64>) -> Result<()>;
     fn predict(&self, x: ArrayView2<f64>) -> Result<InferenceResult>;
+
+    /// A fresh, unfitted model with the same hyperparameters.
+    fn unfitted(&self) -> Self
+    where
+        Self: Sized;
 }
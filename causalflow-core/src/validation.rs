@@ -1,5 +1,7 @@
-use crate::forest::CausalForest;
-use ndarray::{ArrayView1, ArrayView2};
+use crate::errors::{CausalFlowError, Result};
+use crate::forest::{CausalForest, InferenceResult};
+use crate::model::CausalModel;
+use ndarray::{s, Array1, ArrayView1, ArrayView2, Axis};
 
 pub struct ValidationResult {
     pub is_robust: bool,
@@ -48,3 +50,142 @@ pub fn validate_causal_structure(
         }
     }
 }
+
+/// Out-of-fold predictions over contiguous folds. Each fold is scored by an
+/// unfitted model with `model`'s hyperparameters, fitted on the remaining rows,
+/// so the already-processed matrix is only sliced per fold and never rebuilt.
+pub fn cross_val_predict<M: CausalModel>(
+    model: &M,
+    x: ArrayView2<f64>,
+    t: ArrayView1<f64>,
+    y: ArrayView1<f64>,
+    n_folds: usize,
+) -> Result<InferenceResult> {
+    let n_samples = x.nrows();
+    if n_folds < 2 || n_folds > n_samples {
+        return Err(CausalFlowError::InvalidParameter(format!(
+            "n_folds must be between 2 and the number of samples ({}), got {}",
+            n_samples, n_folds
+        )));
+    }
+
+    let mut predictions = Array1::zeros(n_samples);
+    let mut confidence_intervals = vec![(0.0, 0.0); n_samples];
+    let mut feature_importance = vec![0.0; x.ncols()];
+
+    for fold in 0..n_folds {
+        let start = fold * n_samples / n_folds;
+        let end = (fold + 1) * n_samples / n_folds;
+        let train_idx: Vec<usize> = (0..start).chain(end..n_samples).collect();
+
+        let mut fold_model = model.unfitted();
+        fold_model.fit(
+            x.select(Axis(0), &train_idx).view(),
+            t.select(Axis(0), &train_idx).view(),
+            y.select(Axis(0), &train_idx).view(),
+        )?;
+        let res = fold_model.predict(x.slice(s![start..end, ..]))?;
+
+        predictions
+            .slice_mut(s![start..end])
+            .assign(&res.predictions);
+        confidence_intervals[start..end].copy_from_slice(&res.confidence_intervals);
+        for (acc, imp) in feature_importance.iter_mut().zip(&res.feature_importance) {
+            *acc += imp / n_folds as f64;
+        }
+    }
+
+    Ok(InferenceResult {
+        mean_effect: predictions.mean().unwrap_or(0.0),
+        predictions,
+        confidence_intervals,
+        feature_importance,
+    })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use ndarray::{Array1, Array2};
+
+    // Remembers the ids (column 0) of its training rows. Rows it was trained on
+    // predict -1, unseen rows predict the training-set size.
+    struct RecordingModel {
+        train_ids: Vec<f64>,
+    }
+
+    impl CausalModel for RecordingModel {
+        fn fit(
+            &mut self,
+            x: ArrayView2<f64>,
+            _t: ArrayView1<f64>,
+            _y: ArrayView1<f64>,
+        ) -> Result<()> {
+            self.train_ids = x.column(0).to_vec();
+            Ok(())
+        }
+
+        fn predict(&self, x: ArrayView2<f64>) -> Result<InferenceResult> {
+            let predictions: Array1<f64> = x
+                .column(0)
+                .iter()
+                .map(|id| {
+                    if self.train_ids.contains(id) {
+                        -1.0
+                    } else {
+                        self.train_ids.len() as f64
+                    }
+                })
+                .collect();
+            Ok(InferenceResult {
+                predictions,
+                mean_effect: 0.0,
+                confidence_intervals: vec![(0.0, 0.0); x.nrows()],
+                feature_importance: vec![0.0; x.ncols()],
+            })
+        }
+
+        fn unfitted(&self) -> Self {
+            RecordingModel {
+                train_ids: Vec::new(),
+            }
+        }
+    }
+
+    fn rows(n: usize) -> (Array2<f64>, Array1<f64>, Array1<f64>) {
+        let x = Array2::from_shape_fn((n, 1), |(i, _)| i as f64);
+        (x, Array1::zeros(n), Array1::zeros(n))
+    }
+
+    #[test]
+    fn cross_val_predict_scores_every_row_out_of_fold() {
+        let (x, t, y) = rows(10);
+        let model = RecordingModel {
+            train_ids: Vec::new(),
+        };
+
+        // Folds are [0, 3), [3, 6) and [6, 10): training sizes 7, 7 and 6
+        let res = cross_val_predict(&model, x.view(), t.view(), y.view(), 3).unwrap();
+        assert_eq!(
+            res.predictions.to_vec(),
+            vec![7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 6.0, 6.0, 6.0, 6.0]
+        );
+        assert_eq!(res.confidence_intervals.len(), 10);
+    }
+
+    #[test]
+    fn cross_val_predict_rejects_out_of_range_folds() {
+        let (x, t, y) = rows(4);
+        let model = RecordingModel {
+            train_ids: Vec::new(),
+        };
+
+        for n_folds in [0, 1, 5] {
+            assert!(matches!(
+                cross_val_predict(&model, x.view(), t.view(), y.view(), n_folds),
+                Err(CausalFlowError::InvalidParameter(_))
+            ));
+        }
+        assert!(cross_val_predict(&model, x.view(), t.view(), y.view(), 4).is_ok());
+    }
+}
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse
 import causalflow as cf
@@ -14,24 +15,33 @@ T = data.data[:1000, 0] # Use MedInc as treatment
 Y = data.target[:1000]
 model = cf.create_model(features=X, treatment=T, outcome=Y, feature_names=list(data.feature_names))
 
+@lru_cache(maxsize=8)
+def _cached_importance(n):
+    # The model is fitted once at startup, so effects for X[:n] never change.
+    # Call _cached_importance.cache_clear() if the model is ever refitted.
+    return model.estimate_effects(X[:n])
+
 @app.get("/", response_class=HTMLResponse)
 async def index():
     with open("examples/htmx_demo/index.html", "r") as f:
         return f.read()
 
+# The plot handlers are CPU-bound calls into the Rust model, so they are plain
+# `def` endpoints: FastAPI runs those in its thread pool, and since the model
+# releases the GIL while it computes, concurrent requests overlap.
 @app.get("/plot/graph")
-async def plot_graph():
+def plot_graph():
     # Returns just the HTML fragment!
     return HTMLResponse(content=model.to_html(plot_type='graph'))
 
 @app.get("/plot/importance")
-async def plot_importance():
-    results = model.estimate_effects(X[:100])
+def plot_importance():
+    results = _cached_importance(100)
     # Returns just the HTML fragment!
     return HTMLResponse(content=results.to_html())
 
 @app.get("/plot/dist")
-async def plot_dist():
+def plot_dist():
     return HTMLResponse(content=model.to_html(plot_type='effect_dist'))
 
 if __name__ == "__main__":
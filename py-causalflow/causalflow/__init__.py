@@ -1,6 +1,7 @@
 from . import _causalflow
 from ._causalflow import *
 from .preprocessing import DataProcessor
+import weakref
 import pandas as pd
 import numpy as np
 
@@ -9,13 +10,48 @@ class CausalModelWrapper:
         self._model = model
         self._processor = processor
         self.feature_names_out_ = processor.feature_names_out_
+        self._train_ref = None
+        self._train_fingerprint = None
+        self._train_processed = None
+
+    def _remember_training_input(self, x, x_proc):
+        # Scoring on the training set is the common case; keep a weak reference
+        # to the caller's object plus a fingerprint of its contents, so that the
+        # same, unmodified object can skip transform(). Only worth it on the
+        # pandas path: the array fast path is cheaper than hashing the input.
+        if self._processor._transform_fn != self._processor._transform_frame:
+            return
+        try:
+            self._train_ref = weakref.ref(x)
+        except TypeError:
+            # Builtins such as lists cannot be weakly referenced
+            return
+        self._train_fingerprint = _fingerprint(x)
+        self._train_processed = x_proc
+
+    def _is_training_input(self, x):
+        if self._train_ref is None or self._train_ref() is not x:
+            return False
+        # In-place edits (``x[:] = ...``, ``df['a'] = ...``) keep the identity
+        # but change the fingerprint, which falls back to a fresh transform()
+        columns, row_hashes = _fingerprint(x)
+        train_columns, train_row_hashes = self._train_fingerprint
+        return columns == train_columns and np.array_equal(row_hashes, train_row_hashes)
 
     def estimate_effects(self, x):
-        x_proc = self._processor.transform(x)
+        if self._is_training_input(x):
+            x_proc = self._train_processed
+        else:
+            x_proc = self._processor.transform(x)
         return self._model.estimate_effects(x_proc)
     
     def validate(self, n_folds=5, is_time_series=False):
         return self._model.validate(n_folds, is_time_series)
+
+    def cv_predict(self, n_folds=5):
+        # Out-of-fold effects on the training data; the Rust model already holds
+        # the processed matrix, so folds are sliced there without re-preprocessing.
+        return self._model.cv_predict(n_folds)
     
     def show(self, plot_type="graph"):
         return self._model.show(plot_type)
@@ -30,61 +66,56 @@ class CausalModelWrapper:
         # Fallback to the internal Rust model
         return getattr(self._model, name)
 
+def _fingerprint(x):
+    # Column labels plus one vectorized 64-bit hash per row; far cheaper than
+    # re-running the preprocessing pipeline and sensitive to any cell change.
+    frame = x if isinstance(x, pd.DataFrame) else pd.DataFrame(x)
+    return tuple(frame.columns), pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
 def create_model(features, treatment, outcome, method="forest", feature_names=None, use_mice=True):
     """
     High-level factory function with automated preprocessing and unified API.
     """
-    if not isinstance(features, pd.DataFrame):
+    original_features = features
+    if not isinstance(features, (pd.DataFrame, np.ndarray)):
         features = pd.DataFrame(features)
-    
-    if isinstance(treatment, (pd.Series, pd.DataFrame)):
-        treatment_df = pd.DataFrame(treatment)
-    else:
-        treatment_df = pd.DataFrame(treatment, columns=["treatment"])
-        
-    if isinstance(outcome, (pd.Series, pd.DataFrame)):
-        outcome_df = pd.DataFrame(outcome)
-    else:
-        outcome_df = pd.DataFrame(outcome, columns=["outcome"])
 
-    # Align indices and check for NaNs in treatment and outcome
-    # We join them to ensure indices are aligned before dropping
-    combined = pd.concat([features, treatment_df, outcome_df], axis=1)
-    
-    # Identify indices where treatment or outcome are NaN
-    treatment_cols = [f"t_{i}" if i < treatment_df.shape[1] else col for i, col in enumerate(treatment_df.columns)]
-    outcome_cols = [f"y_{i}" if i < outcome_df.shape[1] else col for i, col in enumerate(outcome_df.columns)]
-    
-    # Simpler way to get the mask: use the original dataframes to check for NaNs
-    valid_mask = treatment_df.notna().all(axis=1) & outcome_df.notna().all(axis=1)
-    
-    if not valid_mask.all():
+    # Treatment and outcome are single columns, so plain 1-D float64 arrays
+    # are enough; no DataFrame is built for them
+    # The Rust model keeps these vectors for validate()/cv_predict(), so always
+    # take a private copy rather than a view of the caller's buffer
+    t_numeric = np.array(treatment, dtype=np.float64).ravel()
+    y_numeric = np.array(outcome, dtype=np.float64).ravel()
+
+    # Identify rows where treatment or outcome are NaN
+    valid_mask = ~(np.isnan(t_numeric) | np.isnan(y_numeric))
+    all_rows_kept = valid_mask.all()
+    if not all_rows_kept:
         n_dropped = (~valid_mask).sum()
         print(f"Warning: Dropping {n_dropped} rows due to missing values in treatment or outcome.")
         features = features[valid_mask]
-        treatment_df = treatment_df[valid_mask]
-        outcome_df = outcome_df[valid_mask]
+        t_numeric = t_numeric[valid_mask]
+        y_numeric = y_numeric[valid_mask]
 
     processor = DataProcessor(use_mice=use_mice)
-    
-    # 1. Preprocess features
+
+    # Preprocess features
     x_processed = processor.fit_transform(features)
-    
-    # 2. Preprocess treatment
-    t_numeric = treatment_df.values.flatten()
-        
-    # 3. Preprocess outcome
-    y_numeric = outcome_df.values.flatten()
 
-    # Create the internal Rust model
+    # Create the internal Rust model. All three arrays are contiguous float64
+    # buffers owned by this call, so the extension can read them without
+    # another copy and no caller can modify them afterwards.
     rust_model = _causalflow.create_model(
         x_processed, 
-        t_numeric.astype(np.float64), 
-        y_numeric.astype(np.float64), 
+        t_numeric,
+        y_numeric,
         method, 
         processor.feature_names_out_
     )
     
-    return CausalModelWrapper(rust_model, processor)
+    wrapper = CausalModelWrapper(rust_model, processor)
+    if all_rows_kept:
+        wrapper._remember_training_input(original_features, x_processed)
+    return wrapper
 
 __all__ = ["create_model", "DataProcessor", "CausalModelWrapper"]
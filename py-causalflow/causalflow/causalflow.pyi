@@ -21,6 +21,7 @@ class ValidationResult:
 class Model:
     def estimate_effects(self, x: npt.NDArray[np.float64]) -> InferenceResult: ...
     def validate(self, n_folds: int = 5, is_time_series: bool = False) -> ValidationResult: ...
+    def cv_predict(self, n_folds: int = 5) -> InferenceResult: ...
     def plot_importance(self) -> None: ...
     def plot_effects(self) -> None: ...
     def to_visual_tag(self, plot_type: str = "graph") -> str: ...
@@ -4,98 +4,162 @@ from sklearn.experimental import enable_iterative_imputer
 from sklearn.impute import IterativeImputer, SimpleImputer
 
 class DataProcessor:
-    def __init__(self, use_mice=True):
+    def __init__(self, use_mice=True, dtype=np.float64):
         self.use_mice = use_mice
+        self.dtype = dtype
         self.feature_names_in_ = None
         self.feature_names_out_ = None
         self.categorical_columns_ = []
+        self.numeric_columns_ = []
         self.imputers_ = {}
         self.mice_imputer_ = None
         self.one_hot_encodings_ = {}
+        self.nan_indicator_columns_ = []
+        self._fill_values = None
+        self._transform_fn = self._transform_frame
 
     def fit_transform(self, df):
         if not isinstance(df, pd.DataFrame):
             df = pd.DataFrame(df)
         
         self.feature_names_in_ = df.columns.tolist()
-        processed_df = df.copy()
 
         # 1. Handle Categorical Columns (Simple One-Hot)
         self.categorical_columns_ = df.select_dtypes(include=['object', 'category']).columns.tolist()
         
         # 2. Imputation
         if self.use_mice:
-            # First, simple imputation for categorical columns as MICE needs numeric input
-            for col in self.categorical_columns_:
-                mode_val = processed_df[col].mode()[0] if not processed_df[col].mode().empty else "unknown"
-                processed_df[col] = processed_df[col].fillna(mode_val)
-                self.imputers_[col] = mode_val
+            # One-Hot Encoding BEFORE MICE to ensure all inputs are numeric. Missing
+            # categories get their own indicator column rather than a separate mode
+            # fill pass, but only for columns that actually have gaps in training.
+            # Columns complete in training keep the mode as their fallback for NaNs
+            # seen at transform time.
+            has_nan = df[self.categorical_columns_].isna().any().to_numpy()
+            complete_columns = [col for col, gap in zip(self.categorical_columns_, has_nan) if not gap]
+            self.imputers_ = df[complete_columns].mode().reindex([0]).iloc[0].fillna("unknown").to_dict()
+            self._fit_encoding(
+                df,
+                nan_indicators=[col for col, gap in zip(self.categorical_columns_, has_nan) if gap],
+            )
+            out = self._encode(df)
             
-            # One-Hot Encoding BEFORE MICE to ensure all inputs are numeric
-            if self.categorical_columns_:
-                processed_df = pd.get_dummies(processed_df, columns=self.categorical_columns_)
-            
-            # Now apply MICE to all columns (which are now numeric)
-            self.mice_imputer_ = IterativeImputer(random_state=42)
-            processed_df_values = self.mice_imputer_.fit_transform(processed_df)
-            processed_df = pd.DataFrame(processed_df_values, columns=processed_df.columns)
+            # Now apply MICE to all columns (which are now numeric). Its round-robin
+            # fit is only worth paying for when the training data has gaps; otherwise
+            # keep the column means for any NaNs that show up at transform time.
+            if np.isnan(out).any():
+                # IterativeImputer silently drops all-NaN columns, which would leave
+                # the matrix narrower than feature_names_out_
+                empty = np.isnan(out).all(axis=0)
+                if empty.any():
+                    names = [name for name, is_empty in zip(self.feature_names_out_, empty) if is_empty]
+                    raise ValueError(f"Cannot impute features with no observed values: {names}")
+                self.mice_imputer_ = IterativeImputer(random_state=42)
+                out = np.ascontiguousarray(self.mice_imputer_.fit_transform(out), dtype=self.dtype)
+            else:
+                self.mice_imputer_ = None
+                self.imputers_.update(df.select_dtypes(include='number').mean().to_dict())
         else:
-            # Fallback to Simple Imputation (as before)
-            for col in processed_df.columns:
-                if processed_df[col].dtype.kind in 'iuf':
-                    mean_val = processed_df[col].mean()
-                    processed_df[col] = processed_df[col].fillna(mean_val)
-                    self.imputers_[col] = mean_val
-                else:
-                    mode_val = processed_df[col].mode()[0] if not processed_df[col].mode().empty else "unknown"
-                    processed_df[col] = processed_df[col].fillna(mode_val)
-                    self.imputers_[col] = mode_val
+            # Fallback to Simple Imputation: mean for numeric, mode for the rest
+            numeric_columns = df.select_dtypes(include='number').columns
+            means = df[numeric_columns].mean().to_dict()
+            other_columns = df.columns.difference(numeric_columns, sort=False)
+            # One vectorized mode() over all remaining columns; columns with no
+            # observed value come back as NaN in row 0 and fall back to "unknown"
+            modes = df[other_columns].mode().reindex([0]).iloc[0].fillna("unknown").to_dict()
+            self.imputers_ = {**means, **modes}
+            processed_df = df.fillna(self.imputers_)
 
             # One-Hot Encoding AFTER simple imputation
-            if self.categorical_columns_:
-                processed_df = pd.get_dummies(processed_df, columns=self.categorical_columns_)
-        
-        self.feature_names_out_ = [str(c) for c in processed_df.columns.tolist()]
-        return processed_df.values.astype(np.float64)
+            self._fit_encoding(processed_df, nan_indicators=[])
+            out = self._encode(processed_df)
+
+        self._transform_fn = self._build_transform(df)
+        return out
 
     def transform(self, df):
+        return self._transform_fn(df)
+
+    def _build_transform(self, df):
+        # Pick the cheapest transform the fitted state allows. With only numeric
+        # inputs, no categoricals and no fitted MICE model, an array merely needs
+        # a cast plus a mean fill for any NaNs, so pandas can be skipped.
+        if (
+            self.categorical_columns_
+            or self.mice_imputer_ is not None
+            or df.select_dtypes(exclude=['number', 'bool']).shape[1]
+        ):
+            return self._transform_frame
+        self._fill_values = np.array(
+            [self.imputers_.get(col, np.nan) for col in self.feature_names_in_], dtype=self.dtype
+        )
+        return self._transform_array
+
+    def _transform_array(self, x):
+        if not (
+            isinstance(x, np.ndarray)
+            and x.dtype.kind in 'biuf'
+            and x.ndim == 2
+            and x.shape[1] == len(self.feature_names_in_)
+        ):
+            return self._transform_frame(x)
+
+        out = np.ascontiguousarray(x, dtype=self.dtype)
+        missing = np.isnan(out)
+        if missing.any():
+            # np.where allocates, so the caller's array is never written to
+            out = np.where(missing, self._fill_values, out)
+        return out
+
+    def _transform_frame(self, df):
         if not isinstance(df, pd.DataFrame):
             df = pd.DataFrame(df, columns=self.feature_names_in_)
         
-        processed_df = df.copy()
-        
         if self.use_mice:
-            # Apply simple imputation for categorical columns first (as in fit)
-            for col in self.categorical_columns_:
-                val = self.imputers_.get(col, "unknown")
-                processed_df[col] = processed_df[col].fillna(val)
+            # Modes of complete categoricals, plus means when MICE was skipped at fit
+            processed_df = df.fillna(self.imputers_) if self.imputers_ else df
             
-            # One-Hot Encoding BEFORE MICE
-            if self.categorical_columns_:
-                processed_df = pd.get_dummies(processed_df, columns=self.categorical_columns_)
-                
-                # Align columns (important for dummy variables)
-                missing_cols = set(self.mice_imputer_.feature_names_in_) - set(processed_df.columns)
-                for col in missing_cols:
-                    processed_df[col] = 0
-                processed_df = processed_df[list(self.mice_imputer_.feature_names_in_)]
+            # One-Hot Encoding BEFORE MICE (same layout as in fit)
+            out = self._encode(processed_df)
 
-            # Apply MICE
-            processed_df_values = self.mice_imputer_.transform(processed_df)
-            processed_df = pd.DataFrame(processed_df_values, columns=processed_df.columns)
+            # Apply MICE (None when the training data had no missing values)
+            if self.mice_imputer_ is not None:
+                out = np.ascontiguousarray(self.mice_imputer_.transform(out), dtype=self.dtype)
+            return out
         else:
-            # Apply simple imputation
-            for col, val in self.imputers_.items():
-                processed_df[col] = processed_df[col].fillna(val)
+            # Apply simple imputation, then One-Hot Encoding with the fitted categories
+            return self._encode(df.fillna(self.imputers_))
+
+    def _fit_encoding(self, df, nan_indicators):
+        # Same layout as pd.get_dummies: pass-through columns first, then one
+        # column per (sorted) category, followed by "<col>_nan" where requested
+        self.numeric_columns_ = df.columns.difference(self.categorical_columns_, sort=False).tolist()
+        self.one_hot_encodings_ = {
+            col: pd.Categorical(df[col]).categories for col in self.categorical_columns_
+        }
+        self.nan_indicator_columns_ = nan_indicators
+        self.feature_names_out_ = pd.Index(self.numeric_columns_).astype(str).tolist()
+        for col, categories in self.one_hot_encodings_.items():
+            self.feature_names_out_ += [f"{col}_{category}" for category in categories]
+            if col in nan_indicators:
+                self.feature_names_out_.append(f"{col}_nan")
 
-            # One-Hot Encoding
-            if self.categorical_columns_:
-                processed_df = pd.get_dummies(processed_df, columns=self.categorical_columns_)
-                
-                # Align columns
-                for col in self.feature_names_out_:
-                    if col not in processed_df.columns:
-                        processed_df[col] = 0
-                processed_df = processed_df[self.feature_names_out_]
+    def _encode(self, processed_df):
+        # Write the pass-through columns and the dummies straight into one
+        # preallocated row-major block instead of building a get_dummies frame
+        # and aligning it to the fitted columns. Categories not seen during fit
+        # (code -1) leave their row all zeros.
+        n_rows = len(processed_df)
+        out = np.zeros((n_rows, len(self.feature_names_out_)), dtype=self.dtype)
+        start = len(self.numeric_columns_)
+        out[:, :start] = processed_df[self.numeric_columns_].to_numpy(dtype=self.dtype)
 
-        return processed_df.values.astype(np.float64)
+        rows = np.arange(n_rows)
+        for col, categories in self.one_hot_encodings_.items():
+            codes = pd.Categorical(processed_df[col], categories=categories).codes
+            seen = codes >= 0
+            out[rows[seen], start + codes[seen]] = 1
+            start += len(categories)
+            if col in self.nan_indicator_columns_:
+                out[processed_df[col].isna().to_numpy(), start] = 1
+                start += 1
+        return out
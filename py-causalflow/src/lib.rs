@@ -1,6 +1,6 @@
 use causalflow_core::forest::CausalForest;
-use causalflow_core::validation::validate_causal_structure;
-use numpy::{PyArray1, PyArray2, PyReadonlyArray2, ToPyArray};
+use causalflow_core::validation::{cross_val_predict, validate_causal_structure};
+use numpy::{IntoPyArray, PyArray1, PyArray2, PyReadonlyArray2};
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 
@@ -116,8 +116,9 @@ impl InferenceResult {
     fn get_visual(&self, py: Python, plot_type: &str) -> VisualOutput {
         match plot_type {
             "effect_dist" => {
-                let preds_array = self.predictions.as_ref(py);
-                let preds = preds_array.to_owned_array().to_vec();
+                // Read the numpy buffer in place rather than copying it out
+                let preds_array = self.predictions.as_ref(py).readonly();
+                let preds = preds_array.as_array();
 
                 // Calculate real histogram
                 let min = preds.iter().fold(f64::INFINITY, |a, &b| a.min(b));
@@ -203,6 +204,8 @@ impl CausalMethod {
 #[derive(Clone)]
 struct Model {
     method: CausalMethod,
+    // Private copies made by the Python create_model; they are read through
+    // `as_array()` with the GIL released, so they must never alias user data.
     x: Py<PyArray2<f64>>,
     t: Py<PyArray1<f64>>,
     y: Py<PyArray1<f64>>,
@@ -210,8 +213,16 @@ struct Model {
 }
 
 impl Model {
-    fn get_visual(&self, py: Python, plot_type: &str) -> VisualOutput {
+    // Predicts on the stored training matrix with the GIL released, so other
+    // Python threads (e.g. concurrent web handlers) keep running meanwhile.
+    fn predict_training(&self, py: Python) -> causalflow_core::forest::InferenceResult {
         let x_view = unsafe { self.x.as_ref(py).as_array() };
+        let method = &self.method;
+        py.allow_threads(|| method.as_trait().predict(x_view))
+            .unwrap() // Simplified for visual
+    }
+
+    fn get_visual(&self, py: Python, plot_type: &str) -> VisualOutput {
         match plot_type {
             "graph" => {
                 let mut nodes = Vec::new();
@@ -235,7 +246,7 @@ impl Model {
                     weight: 1.0,
                 });
 
-                let res = self.method.as_trait().predict(x_view).unwrap_or_else(|_| self.method.as_trait().predict(x_view).unwrap()); // Simplified for visual
+                let res = self.predict_training(py);
                 let importance = res.feature_importance;
 
                 if let Some(names) = &self.feature_names {
@@ -262,7 +273,7 @@ impl Model {
                 VisualOutput::causal_graph(nodes, links)
             }
             "effect_dist" => {
-                let res = self.method.as_trait().predict(x_view).unwrap_or_else(|_| self.method.as_trait().predict(x_view).unwrap());
+                let res = self.predict_training(py);
                 let preds = res.predictions.to_vec();
 
                 // Calculate real histogram
@@ -331,11 +342,13 @@ impl Model {
     }
 
     fn estimate_effects(&self, py: Python, x: PyReadonlyArray2<f64>) -> PyResult<InferenceResult> {
-        let core_res = self.method.as_trait().predict(x.as_array())?;
+        let x_view = x.as_array();
+        let method = &self.method;
+        let core_res = py.allow_threads(|| method.as_trait().predict(x_view))?;
 
         Ok(InferenceResult {
             mean_effect: core_res.mean_effect,
-            predictions: core_res.predictions.to_pyarray(py).to_owned(),
+            predictions: core_res.predictions.into_pyarray(py).to_owned(),
             confidence_intervals: core_res.confidence_intervals,
             feature_importance: core_res.feature_importance,
             feature_names: self.feature_names.clone(),
@@ -354,7 +367,9 @@ impl Model {
         };
         
         if let CausalMethod::Forest(ref forest) = self.method {
-            let res = validate_causal_structure(forest, x_view, t_view, y_view, n_folds);
+            let res = py.allow_threads(|| {
+                validate_causal_structure(forest, x_view, t_view, y_view, n_folds)
+            });
             Ok(ValidationResult {
                 is_robust: res.is_robust,
                 message: res.message,
@@ -367,6 +382,35 @@ impl Model {
         }
     }
 
+    #[pyo3(signature = (n_folds = 5))]
+    fn cv_predict(&self, py: Python, n_folds: usize) -> PyResult<InferenceResult> {
+        let (x_view, t_view, y_view) = unsafe {
+            (
+                self.x.as_ref(py).as_array(),
+                self.t.as_ref(py).as_array(),
+                self.y.as_ref(py).as_array(),
+            )
+        };
+
+        let method = &self.method;
+        let core_res = py.allow_threads(|| match method {
+            CausalMethod::Forest(forest) => {
+                cross_val_predict(forest, x_view, t_view, y_view, n_folds)
+            }
+            CausalMethod::Linear(linear) => {
+                cross_val_predict(linear, x_view, t_view, y_view, n_folds)
+            }
+        })?;
+
+        Ok(InferenceResult {
+            mean_effect: core_res.mean_effect,
+            predictions: core_res.predictions.into_pyarray(py).to_owned(),
+            confidence_intervals: core_res.confidence_intervals,
+            feature_importance: core_res.feature_importance,
+            feature_names: self.feature_names.clone(),
+        })
+    }
+
     fn plot_importance(&self, py: Python) {
         println!("{}", self.to_visual_tag(py, "importance"));
     }
@@ -397,13 +441,14 @@ fn create_model(
         }
     };
 
-    unsafe {
-        causal_method.as_trait_mut().fit(
+    let (x_view, t_view, y_view) = unsafe {
+        (
             features.as_ref(py).as_array(),
             treatment.as_ref(py).as_array(),
             outcome.as_ref(py).as_array(),
-        )?;
-    }
+        )
+    };
+    py.allow_threads(|| causal_method.as_trait_mut().fit(x_view, t_view, y_view))?;
 
     Ok(Model {
         method: causal_method,
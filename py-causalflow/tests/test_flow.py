@@ -62,3 +62,145 @@ def test_invalid_method():
     y = [1]
     with pytest.raises(ValueError, match="Unknown method"):
         causalflow.create_model(x, t, y, method='unknown_algo')
+
+def test_processor_output_is_row_major():
+    # The Rust forest walks rows, so the processed matrix must be C-contiguous
+    df = pd.DataFrame({
+        'feature1': [1.0, 2.0, 3.0],
+        'feature2': [10.0, 20.0, 30.0]
+    })
+    processor = causalflow.DataProcessor(use_mice=False)
+    x_fit = processor.fit_transform(df)
+    x_new = processor.transform(df)
+
+    assert x_fit.flags['C_CONTIGUOUS']
+    assert x_new.flags['C_CONTIGUOUS']
+    assert x_fit.dtype == np.float64
+
+def test_processor_output_dtype():
+    df = pd.DataFrame({'feature1': [1.0, np.nan, 3.0], 'category1': ['A', 'B', 'A']})
+    processor = causalflow.DataProcessor(use_mice=False, dtype=np.float32)
+    assert processor.fit_transform(df).dtype == np.float32
+    assert processor.transform(df).dtype == np.float32
+
+def test_estimate_effects_reuses_training_matrix(monkeypatch):
+    # Scoring the exact training object should not re-run preprocessing
+    df = pd.DataFrame({'feature1': [1.0, 3.0, 5.0], 'category1': ['A', 'B', 'A']})
+    t = np.array([0, 1, 0], dtype=np.float64)
+    y = np.array([1, 10, 1], dtype=np.float64)
+    model = causalflow.create_model(df, t, y, method='linear', use_mice=False)
+
+    def fail_transform(_):
+        raise AssertionError("transform should be skipped for the training input")
+
+    monkeypatch.setattr(model._processor, "transform", fail_transform)
+    res = model.estimate_effects(df)
+    assert abs(res.mean_effect - 9.0) < 1e-5
+
+def test_estimate_effects_skips_cache_on_array_path():
+    # The numeric fast path is cheaper than fingerprinting, so nothing is cached
+    x = np.array([[1, 2], [3, 4]], dtype=np.float64)
+    t = np.array([0, 1], dtype=np.float64)
+    y = np.array([1, 10], dtype=np.float64)
+    model = causalflow.create_model(x, t, y, method='linear')
+    assert model._train_fingerprint is None
+    assert model._train_processed is None
+    res = model.estimate_effects(x)
+    assert abs(res.mean_effect - 9.0) < 1e-5
+
+def test_estimate_effects_detects_in_place_edits(monkeypatch):
+    # Mutating the training object must not serve the cached matrix
+    df = pd.DataFrame({'feature1': [1.0, 2.0, 3.0], 'category1': ['A', 'B', 'A']})
+    t = np.array([0, 1, 0], dtype=np.float64)
+    y = np.array([1, 10, 1], dtype=np.float64)
+    model = causalflow.create_model(df, t, y, method='linear', use_mice=False)
+    assert model._train_fingerprint is not None
+
+    df['feature1'] = [7.0, 8.0, 9.0]
+    seen = []
+    original_transform = model._processor.transform
+    def spy_transform(x):
+        seen.append(x)
+        return original_transform(x)
+
+    monkeypatch.setattr(model._processor, "transform", spy_transform)
+    model.estimate_effects(df)
+    assert len(seen) == 1
+
+def test_transform_aligns_unseen_categories():
+    # Categories missing at transform time must still produce the fitted columns
+    df = pd.DataFrame({
+        'feature1': [10, 20, 30],
+        'category1': ['A', 'B', 'C']
+    })
+    processor = causalflow.DataProcessor(use_mice=False)
+    processor.fit_transform(df)
+
+    new_df = pd.DataFrame({'feature1': [15], 'category1': ['B']})
+    out = processor.transform(new_df)
+    assert out.shape == (1, len(processor.feature_names_out_))
+    assert out.tolist() == [[15.0, 0.0, 1.0, 0.0]]
+
+def test_cv_predict():
+    # Out-of-fold predictions cover every training row
+    x = np.arange(40, dtype=np.float64).reshape(20, 2)
+    t = np.tile([0.0, 1.0], 10)
+    y = 1.0 + 9.0 * t
+    model = causalflow.create_model(x, t, y, method='linear')
+
+    res = model.cv_predict(n_folds=4)
+    assert len(res.predictions) == 20
+    assert abs(res.mean_effect - 9.0) < 1e-5
+
+    with pytest.raises(ValueError, match="n_folds"):
+        model.cv_predict(n_folds=1)
+
+def test_one_hot_matches_get_dummies():
+    # The direct encoder must keep the pd.get_dummies column layout and values
+    df = pd.DataFrame({
+        'category1': ['B', 'A', 'C', 'A'],
+        'feature1': [1.0, 2.0, 3.0, 4.0],
+        'category2': pd.Categorical(['x', 'y', 'x', 'x'], categories=['y', 'x', 'z']),
+        'flag': [True, False, True, False]
+    })
+    processor = causalflow.DataProcessor(use_mice=False)
+    out = processor.fit_transform(df)
+
+    expected = pd.get_dummies(df, columns=['category1', 'category2'])
+    assert processor.feature_names_out_ == expected.columns.astype(str).tolist()
+    np.testing.assert_array_equal(out, expected.to_numpy(dtype=np.float64))
+    np.testing.assert_array_equal(processor.transform(df), out)
+
+def test_numeric_transform_fast_path():
+    # Numeric-only processors transform arrays without a pandas round-trip
+    x = np.array([[1.0, 10.0], [np.nan, 20.0], [3.0, 30.0]])
+    processor = causalflow.DataProcessor(use_mice=False)
+    fitted = processor.fit_transform(x)
+
+    new_x = np.array([[np.nan, 25.0], [4.0, np.nan]])
+    snapshot = new_x.copy()
+    out = processor.transform(new_x)
+
+    # Same result as the generic pandas pipeline, and the input is left untouched
+    np.testing.assert_array_equal(out, processor._transform_frame(new_x))
+    assert out.tolist() == [[2.0, 25.0], [4.0, 20.0]]
+    assert out.flags['C_CONTIGUOUS']
+    np.testing.assert_array_equal(new_x, snapshot)
+    np.testing.assert_array_equal(processor.transform(x), fitted)
+
+def test_create_model_copies_treatment_and_outcome(monkeypatch):
+    # The model keeps treatment/outcome for validation; they must not alias inputs
+    x = np.array([[1, 2], [3, 4]], dtype=np.float64)
+    t = np.array([0, 1], dtype=np.float64)
+    y = np.array([1, 10], dtype=np.float64)
+
+    passed = {}
+    original_create = causalflow._causalflow.create_model
+    def spy_create(features, treatment, outcome, *args):
+        passed.update(t=treatment, y=outcome)
+        return original_create(features, treatment, outcome, *args)
+
+    monkeypatch.setattr(causalflow._causalflow, "create_model", spy_create)
+    causalflow.create_model(x, t, y, method='linear')
+    assert not np.shares_memory(passed['t'], t)
+    assert not np.shares_memory(passed['y'], y)
@@ -2,6 +2,7 @@ import sys
 import os
 import pandas as pd
 import numpy as np
+import pytest
 
 # Add the project root to sys.path so we can import causalflow
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -62,11 +63,78 @@ def test_mice_toggle():
     model = causalflow.create_model(features, treatment, outcome, method="forest", use_mice=False)
     print("MICE toggle test: SUCCESS")
 
+def test_mice_skipped_without_missing_values():
+    print("Testing MICE skip on complete data...")
+    df = pd.DataFrame({
+        'x1': [1.0, 2.0, 3.0, 4.0],
+        'x2': [4.0, 3.0, 2.0, 1.0]
+    })
+    
+    processor = causalflow.DataProcessor(use_mice=True)
+    processor.fit_transform(df)
+    assert processor.mice_imputer_ is None
+    
+    # NaNs at prediction time still fall back to the training means
+    out = processor.transform(pd.DataFrame({'x1': [np.nan], 'x2': [1.0]}))
+    assert out.tolist() == [[2.5, 1.0]]
+    print("MICE skip test: SUCCESS")
+
+def test_mice_categorical_nan_indicator():
+    print("Testing MICE categorical NaN indicator...")
+    df = pd.DataFrame({
+        'x1': [1.0, 2.0, np.nan, 4.0],
+        'c1': ['A', None, 'B', 'A'],
+        'c2': ['X', 'Y', 'X', 'Y']
+    })
+    
+    processor = causalflow.DataProcessor(use_mice=True)
+    out = processor.fit_transform(df)
+    
+    # Only categories that were actually missing get an indicator column
+    assert processor.feature_names_out_ == ['x1', 'c1_A', 'c1_B', 'c1_nan', 'c2_X', 'c2_Y']
+    assert out[1].tolist()[1:] == [0.0, 0.0, 1.0, 0.0, 1.0]
+    
+    new_df = pd.DataFrame({'x1': [3.0], 'c1': ['B'], 'c2': [None]})
+    assert processor.transform(new_df).shape == (1, 6)
+    print("MICE categorical NaN indicator test: SUCCESS")
+
+def test_mice_complete_categorical_uses_mode():
+    print("Testing MICE mode fallback for complete categoricals...")
+    df = pd.DataFrame({
+        'x1': [1.0, np.nan, 3.0, 4.0],
+        'c1': ['A', 'B', 'B', 'B']
+    })
+    
+    processor = causalflow.DataProcessor(use_mice=True)
+    processor.fit_transform(df)
+    assert processor.feature_names_out_ == ['x1', 'c1_A', 'c1_B']
+    
+    # c1 had no gaps in training, so a NaN falls back to its mode 'B'
+    out = processor.transform(pd.DataFrame({'x1': [1.0], 'c1': [None]}))
+    assert out[0].tolist()[1:] == [0.0, 1.0]
+    print("MICE mode fallback test: SUCCESS")
+
+def test_mice_rejects_all_nan_feature():
+    print("Testing MICE with an all-NaN feature...")
+    df = pd.DataFrame({
+        'a': [1.0, 2.0, 3.0],
+        'b': [np.nan, np.nan, np.nan]
+    })
+    
+    processor = causalflow.DataProcessor(use_mice=True)
+    with pytest.raises(ValueError, match="no observed values"):
+        processor.fit_transform(df)
+    print("MICE all-NaN feature test: SUCCESS")
+
 if __name__ == "__main__":
     try:
         test_mice_imputation()
         test_treatment_outcome_nan()
         test_mice_toggle()
+        test_mice_skipped_without_missing_values()
+        test_mice_categorical_nan_indicator()
+        test_mice_complete_categorical_uses_mode()
+        test_mice_rejects_all_nan_feature()
         print("\nAll tests passed successfully!")
     except Exception as e:
         print(f"\nTest failed with error: {e}")